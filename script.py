@@ -1,15 +1,24 @@
 import argparse
 import asyncio
+import hashlib
+import json
 import os
 import re
-from typing import List
-
+import sqlite3
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, AsyncIterator, List, Optional
+
+import httpx
+import tiktoken
 from mcp import ClientSession, types
 from mcp.client.streamable_http import streamablehttp_client
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, NotFoundError
 from pydantic import BaseModel
 from rich import box
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 
@@ -17,9 +26,69 @@ from rich.table import Table
 DEFAULT_MCP_ENDPOINT = os.environ.get("MCP_ENDPOINT", "http://localhost:8080/mcp")
 DEFAULT_LLM_ENDPOINT = os.environ.get("LLM_ENDPOINT", "http://127.0.0.1:1234/v1")
 DEFAULT_PEOPLE = ["Sam Altman", "Elon Musk", "Donald Trump"]
+# Left as a string so argparse validates it with positive_int like the CLI flag.
+DEFAULT_LLM_PARALLEL = os.environ.get("LLM_PARALLEL", "4")
+DEFAULT_CACHE_PATH = os.environ.get("ANALYZER_CACHE", "~/.cache/podcast-analyzer/cache.sqlite3")
+CACHE_TTL_SECONDS = 7 * 86400
+
+# LLM settings; they are part of the on-disk cache key.
+LLM_MODEL = "local"
+SUMMARY_TEMPERATURE = 0.3
+SUMMARY_MAX_TOKENS = 200
+
+# How much of each transcript the LLM sees. Tokens are counted with tiktoken's
+# cl100k_base as a close-enough proxy; if it can't load we fall back to characters.
+MAX_TRANSCRIPT_TOKENS = 1500
+MAX_TRANSCRIPT_CHARS = 3000
+
+# Search results look like "1. <title>" followed by "   URL: <url>" lines, so a
+# single pass picks up each numbered title and the YouTube watch URLs under it.
+_SEARCH_RESULT_RE = re.compile(
+    r"^\s*\d+\.\s+(?P<title>[^\n]+)|(?P<url>https?://(?:[\w-]+\.)?youtube\.com/watch\?[^\s]+)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Instructions go in a byte-identical system message ahead of the transcript so
+# llama.cpp can reuse the KV cache for this prefix instead of re-running prefill.
+_STATIC_INSTRUCTION = (
+    "Extract 3-5 topics (comma-separated) and 2 key insights (brief) from the transcript. "
+    'Return JSON {"topics": "...", "insights": "..."}.'
+)
+_STATIC_BATCH_INSTRUCTION = (
+    "For each transcript, extract 3-5 topics (comma-separated) and 2 key insights (brief). "
+    'Return JSON {"summaries": [{"topics": "...", "insights": "..."}, ...]} in the same order.'
+)
 
 console = Console()
 
+# Summaries keyed by a hash of the transcript prefix the LLM actually sees.
+_SUM_CACHE: dict[str, dict] = {}
+
+# Optional near-duplicate tier, enabled with --semantic-cache.
+SEMANTIC_MODEL = "all-MiniLM-L6-v2"
+SEMANTIC_THRESHOLD = 0.92
+_semantic_model: Any = None
+_semantic_entries: list[tuple[Any, dict]] = []
+
+# Caps in-flight LLM requests at the server's slot count (--parallel in
+# scripts/start_llm_server.sh); extra requests would only queue server-side.
+# Created in main() from --llm-parallel.
+_llm_slots: Optional[asyncio.Semaphore] = None
+
+# Optional gateway tool taking {"urls": [...]} and returning one text block per
+# URL, in order. The stock youtube_transcript server only has get_transcript;
+# a gateway that adds this saves one MCP round-trip per video.
+BATCH_TRANSCRIPT_TOOL = "get_transcripts"
+
+# Tool names the gateway advertised during check_mcp.
+_mcp_tools: set[str] = set()
+
+# tiktoken encoder, loaded in main(); None means truncate by characters.
+_encoder: Optional[tiktoken.Encoding] = None
+
+# Persistent cache shared across runs; opened in main() unless --no-cache.
+_disk_cache: Optional["DiskCache"] = None
+
 
 def positive_int(value: str) -> int:
     """argparse helper to require positive integers."""
@@ -39,44 +108,324 @@ class Podcast(BaseModel):
     insights: str = "N/A"
 
 
-async def summarize(llm_client: AsyncOpenAI, text: str) -> dict:
-    """Extract topics and insights from transcript."""
-    response = await llm_client.chat.completions.create(
-        model="local",
-        messages=[{
-            "role": "user",
-            "content": f"Extract 3-5 topics (comma-separated) and 2 key insights (brief) from:\n\n{text[:3000]}"
-        }],
-        temperature=0.3,
-        max_tokens=200
+class Transcript(BaseModel):
+    """A fetched video transcript waiting to be summarized."""
+
+    person: str
+    title: str
+    url: str
+    text: str
+
+
+class DiskCache:
+    """Tiny sqlite key/value store whose entries expire after a TTL."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, expires_at INTEGER)"
+        )
+        self._db.execute("DELETE FROM cache WHERE expires_at < ?", (int(time.time()),))
+        self._db.commit()
+
+    def get(self, key: str) -> Any:
+        row = self._db.execute(
+            "SELECT value FROM cache WHERE key = ? AND expires_at >= ?", (key, int(time.time()))
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Any, ttl: int = CACHE_TTL_SECONDS) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO cache VALUES (?, ?, ?)",
+            (key, json.dumps(value), int(time.time()) + ttl),
+        )
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def enable_semantic_cache() -> bool:
+    """Load the embedding model used to match near-identical transcripts."""
+    global _semantic_model
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        console.print("[yellow]--semantic-cache needs 'sentence-transformers' (uv pip install sentence-transformers); using exact-match cache only.[/yellow]")
+        return False
+    _semantic_model = SentenceTransformer(SEMANTIC_MODEL)
+    return True
+
+
+def _semantic_lookup(embedding: Any) -> Optional[dict]:
+    """Return the cached summary closest to `embedding` if it clears the threshold."""
+    best_score, best = 0.0, None
+    for cached_embedding, summary in _semantic_entries:
+        # Embeddings are normalized, so the dot product is the cosine similarity.
+        score = float(embedding @ cached_embedding)
+        if score > best_score:
+            best_score, best = score, summary
+    return best if best_score >= SEMANTIC_THRESHOLD else None
+
+
+async def load_encoder() -> None:
+    """Load the tiktoken encoder off the event loop (the first call downloads its BPE file)."""
+    global _encoder
+    try:
+        _encoder = await asyncio.to_thread(tiktoken.get_encoding, "cl100k_base")
+    except Exception as e:
+        console.print(f"[yellow]Couldn't load the tiktoken encoder ({str(e)[:80]}); truncating transcripts to {MAX_TRANSCRIPT_CHARS} characters instead.[/yellow]")
+
+
+def truncate_transcript(text: str) -> str:
+    """Trim a transcript to the slice the LLM gets to see."""
+    if _encoder is None:
+        return text[:MAX_TRANSCRIPT_CHARS]
+    # Tokens average well under 8 characters, so there's no need to encode the whole transcript.
+    tokens = _encoder.encode(text[:MAX_TRANSCRIPT_TOKENS * 8])
+    return _encoder.decode(tokens[:MAX_TRANSCRIPT_TOKENS])
+
+
+def _summary_keys(prefix: str) -> tuple[str, str]:
+    """In-memory and on-disk cache keys for a transcript prefix."""
+    key = hashlib.blake2b(prefix.encode(), digest_size=16).hexdigest()
+    # The prompts are part of the key so rewording them invalidates old summaries.
+    disk_key = "summary:" + hashlib.sha256(
+        f"{LLM_MODEL}|{SUMMARY_TEMPERATURE}|{SUMMARY_MAX_TOKENS}|"
+        f"{_STATIC_INSTRUCTION}|{_STATIC_BATCH_INSTRUCTION}|{prefix}".encode()
+    ).hexdigest()
+    return key, disk_key
+
+
+async def _lookup_summary(prefix: str) -> tuple[Optional[dict], Any]:
+    """Check every cache tier; also returns the prefix embedding for later storage."""
+    key, disk_key = _summary_keys(prefix)
+    if key in _SUM_CACHE:
+        return _SUM_CACHE[key], None
+
+    # Exact disk hits beat approximate matches and don't need an embedding.
+    cached = _disk_cache.get(disk_key) if _disk_cache else None
+    if cached is not None:
+        _SUM_CACHE[key] = cached
+        return cached, None
+
+    embedding = None
+    if _semantic_model is not None:
+        embedding = await asyncio.to_thread(
+            _semantic_model.encode, prefix, normalize_embeddings=True
+        )
+        cached = _semantic_lookup(embedding)
+        if cached is not None:
+            _SUM_CACHE[key] = cached
+    return cached, embedding
+
+
+def _store_summary(prefix: str, summary: dict, embedding: Any) -> None:
+    """Record a fresh summary in every cache tier."""
+    key, disk_key = _summary_keys(prefix)
+    _SUM_CACHE[key] = summary
+    if embedding is not None:
+        _semantic_entries.append((embedding, summary))
+    if _disk_cache:
+        _disk_cache.set(disk_key, summary)
+
+
+async def summarize_batch(llm_client: AsyncOpenAI, texts: List[str]) -> List[dict]:
+    """Summarize several transcripts, sending all cache misses in one LLM request."""
+    prefixes = [truncate_transcript(text) for text in texts]
+    lookups = [await _lookup_summary(prefix) for prefix in prefixes]
+    summaries = [summary for summary, _ in lookups]
+    misses = [i for i, summary in enumerate(summaries) if summary is None]
+    if not misses:
+        return summaries
+
+    fresh = await _summarize_batch_uncached(llm_client, [prefixes[i] for i in misses])
+    retry = [j for j, summary in enumerate(fresh) if summary is None]
+    if retry:
+        # Small models don't always follow the JSON contract; redo those one call each.
+        redone = await asyncio.gather(
+            *[_summarize_uncached(llm_client, prefixes[misses[j]]) for j in retry]
+        )
+        for j, summary in zip(retry, redone):
+            fresh[j] = summary
+
+    for i, summary in zip(misses, fresh):
+        summaries[i] = summary
+        _store_summary(prefixes[i], summary, lookups[i][1])
+    return summaries
+
+
+async def _summarize_batch_uncached(
+    llm_client: AsyncOpenAI, texts: List[str]
+) -> List[Optional[dict]]:
+    """Ask the LLM for topics and insights of several transcripts as one JSON reply.
+
+    Entries are None where the reply didn't yield a usable summary.
+    """
+    if len(texts) == 1:
+        return [await _summarize_uncached(llm_client, texts[0])]
+
+    transcripts = "\n---\n".join(
+        f"TRANSCRIPT {i}:\n{text}" for i, text in enumerate(texts, start=1)
     )
-    
-    content = response.choices[0].message.content
-    
-    # Simple parsing
+    async with _llm_slots:
+        response = await llm_client.chat.completions.create(
+            model=LLM_MODEL,
+            messages=[
+                {"role": "system", "content": _STATIC_BATCH_INSTRUCTION},
+                {"role": "user", "content": transcripts},
+            ],
+            temperature=SUMMARY_TEMPERATURE,
+            max_tokens=SUMMARY_MAX_TOKENS * len(texts),
+            response_format={"type": "json_object"},
+            extra_body={"cache_prompt": True},
+        )
+
+    choice = response.choices[0]
+    content = choice.message.content or ""
+    if choice.finish_reason == "length":
+        # Ran out of tokens mid-reply: keep the summaries that finished.
+        items = _complete_summaries(content)
+    else:
+        try:
+            items = json.loads(content)["summaries"]
+        except (ValueError, KeyError, TypeError):
+            items = []
+        if not isinstance(items, list) or len(items) != len(texts):
+            # Without one entry per transcript we can't trust the order.
+            items = []
+
+    summaries: List[Optional[dict]] = []
+    for item in items[:len(texts)]:
+        try:
+            summaries.append(_summary_from_json(item))
+        except (KeyError, TypeError):
+            summaries.append(None)
+    return summaries + [None] * (len(texts) - len(summaries))
+
+
+def _complete_summaries(content: str) -> List[dict]:
+    """Parse the summary objects that were finished before a reply got cut off."""
+    decoder = json.JSONDecoder()
+    items = []
+    pos = content.find("[") + 1
+    while pos > 0:
+        while pos < len(content) and content[pos] in " \t\r\n,":
+            pos += 1
+        try:
+            item, pos = decoder.raw_decode(content, pos)
+        except ValueError:
+            break
+        items.append(item)
+    return items
+
+
+async def _summarize_uncached(llm_client: AsyncOpenAI, text: str) -> dict:
+    """Ask the LLM for topics and insights as a JSON object."""
+    async with _llm_slots:
+        response = await llm_client.chat.completions.create(
+            model=LLM_MODEL,
+            messages=[
+                {"role": "system", "content": _STATIC_INSTRUCTION},
+                {"role": "user", "content": text},
+            ],
+            temperature=SUMMARY_TEMPERATURE,
+            max_tokens=SUMMARY_MAX_TOKENS,
+            response_format={"type": "json_object"},
+            extra_body={"cache_prompt": True},
+        )
+
+    content = response.choices[0].message.content or ""
+    try:
+        return _summary_from_json(json.loads(content))
+    except (ValueError, KeyError, TypeError):
+        # Some models ignore JSON mode; salvage what we can from free text.
+        return _parse_summary(content)
+
+
+def _summary_from_json(item: dict) -> dict:
+    """Normalize one {"topics", "insights"} object from the LLM."""
+    topics, insights = item["topics"], item["insights"]
+    # Small models often return arrays here despite the prompt asking for strings.
+    if isinstance(topics, list):
+        topics = ", ".join(map(str, topics))
+    if isinstance(insights, list):
+        insights = "\n".join(map(str, insights))
+    return {"topics": str(topics)[:80], "insights": str(insights)[:150]}
+
+
+def _parse_summary(content: str) -> dict:
+    """Pull topics and insights out of a free-form LLM reply (JSON-mode fallback)."""
     topics = "General discussion"
     insights = "Various topics discussed"
     
     lines = content.split('\n')
     for i, line in enumerate(lines):
-        if 'topic' in line.lower() and i + 1 < len(lines):
+        lowered = line.lower()
+        if 'topic' in lowered and i + 1 < len(lines):
             topics = lines[i + 1].strip()[:80]
-        elif 'insight' in line.lower() and i + 1 < len(lines):
+        elif 'insight' in lowered and i + 1 < len(lines):
             insights = '\n'.join(lines[i + 1:])[:150]
     
     return {"topics": topics, "insights": insights}
 
 
-async def fetch_podcasts(
+async def get_transcript(session: ClientSession, url: str) -> str:
+    """Fetch a video transcript via MCP, reusing the on-disk copy when present."""
+    key = f"transcript:{url}"
+    if _disk_cache:
+        cached = _disk_cache.get(key)
+        if cached is not None:
+            return cached
+
+    transcript_result = await session.call_tool("get_transcript", arguments={"url": url})
+
+    transcript = "".join(
+        block.text for block in transcript_result.content if isinstance(block, types.TextContent)
+    )
+    if transcript_result.isError:
+        # Rate limits and missing transcripts come back as error text; never cache them.
+        raise RuntimeError(transcript or "get_transcript failed")
+
+    if transcript and _disk_cache:
+        _disk_cache.set(key, transcript)
+    return transcript
+
+
+async def get_transcripts(session: ClientSession, urls: List[str]) -> Optional[List[str]]:
+    """Fetch several transcripts in one MCP call; None when the gateway can't batch."""
+    if BATCH_TRANSCRIPT_TOOL not in _mcp_tools:
+        return None
+
+    transcripts = {url: _disk_cache.get(f"transcript:{url}") for url in urls} if _disk_cache else {}
+    missing = [url for url in urls if transcripts.get(url) is None]
+    if missing:
+        try:
+            result = await session.call_tool(BATCH_TRANSCRIPT_TOOL, arguments={"urls": missing})
+        except Exception:
+            return None
+        texts = [block.text for block in result.content if isinstance(block, types.TextContent)]
+        if result.isError or len(texts) != len(missing):
+            return None
+
+        for url, transcript in zip(missing, texts):
+            transcripts[url] = transcript
+            if transcript and _disk_cache:
+                _disk_cache.set(f"transcript:{url}", transcript)
+
+    return [transcripts[url] for url in urls]
+
+
+async def fetch_transcripts(
     session: ClientSession,
-    llm_client: AsyncOpenAI,
     person: str,
     *,
     videos_per_person: int,
     max_search_results: int,
-) -> List[Podcast]:
-    """Fetch and analyze YouTube podcasts for a person."""
-    podcasts = []
+) -> List[Transcript]:
+    """Find YouTube podcasts for a person and fetch their transcripts."""
+    transcripts = []
 
     # Search
     result = await session.call_tool(
@@ -88,76 +437,127 @@ async def fetch_podcasts(
     urls = []
     for block in result.content:
         if isinstance(block, types.TextContent):
-            for line in block.text.split('\n'):
-                if 'youtube.com/watch' in line.lower():
-                    match = re.search(r'https?://[^\s]+', line)
-                    if match:
-                        urls.append((line.split('\n')[0], match.group(0)))
+            title = None
+            for match in _SEARCH_RESULT_RE.finditer(block.text):
+                if match.group("title"):
+                    title = match.group("title").strip()
+                else:
+                    urls.append((title or match.group("url"), match.group("url")))
     
     if not urls:
         console.print(f"[yellow]No YouTube results found for {person}. Try another query.[/yellow]")
-        return podcasts
+        return transcripts
+
+    urls = urls[:videos_per_person]
+    texts = await get_transcripts(session, [url for _, url in urls])
+    if texts is not None:
+        transcripts.extend(
+            Transcript.model_construct(person=person, title=title, url=url, text=text)
+            for (title, url), text in zip(urls, texts)
+            if text
+        )
+        return transcripts
 
-    # Process videos
-    for title, url in urls[:videos_per_person]:
+    async def _process_one(title: str, url: str) -> Optional[Transcript]:
         try:
-            # Get transcript
-            transcript_result = await session.call_tool("get_transcript", arguments={"url": url})
-            
-            transcript = ""
-            for block in transcript_result.content:
-                if isinstance(block, types.TextContent):
-                    transcript += block.text
+            transcript = await get_transcript(session, url)
             
             if not transcript:
-                continue
+                return None
             
-            # Summarize
-            summary = await summarize(llm_client, transcript)
-            
-            podcasts.append(Podcast(
-                person=person,
-                title=title[:50] + "..." if len(title) > 50 else title,
-                url=url,
-                topics=summary['topics'],
-                insights=summary['insights']
-            ))
+            return Transcript.model_construct(person=person, title=title, url=url, text=transcript)
             
         except Exception as e:
             console.print(f"[dim red]Skipped {url[:30]}...: {str(e)[:50]}[/dim red]")
-            continue
-    
-    return podcasts
+            return None
+
+    # Fetch transcripts concurrently
+    results = await asyncio.gather(
+        *[_process_one(title, url) for title, url in urls],
+        return_exceptions=True,
+    )
+    transcripts.extend(r for r in results if isinstance(r, Transcript))
+
+    return transcripts
+
 
+async def summarize_transcripts(
+    llm_client: AsyncOpenAI,
+    transcripts: List[Transcript],
+    *,
+    batch_size: int,
+) -> AsyncIterator[List[Podcast]]:
+    """Summarize transcripts in batches, yielding each batch's podcasts as it finishes."""
+    batches = [transcripts[i:i + batch_size] for i in range(0, len(transcripts), batch_size)]
+
+    async def _process_batch(batch: List[Transcript]) -> List[Podcast]:
+        try:
+            summaries = await summarize_batch(llm_client, [t.text for t in batch])
+        except Exception as e:
+            for t in batch:
+                console.print(f"[dim red]Skipped {t.url[:30]}...: {str(e)[:50]}[/dim red]")
+            return []
+
+        return [
+            # Fields are already strings we built ourselves, so skip validation.
+            Podcast.model_construct(
+                person=t.person,
+                title=t.title[:50] + "..." if len(t.title) > 50 else t.title,
+                url=t.url,
+                topics=summary['topics'],
+                insights=summary['insights']
+            )
+            for t, summary in zip(batch, summaries)
+        ]
 
-async def verify_services(llm_client: AsyncOpenAI, mcp_endpoint: str) -> bool:
-    """Confirm the LLM server and MCP gateway are reachable."""
-    healthy = True
+    for next_batch in asyncio.as_completed([_process_batch(batch) for batch in batches]):
+        yield await next_batch
 
+
+def _root_error(error: BaseException) -> BaseException:
+    """Unwrap task-group errors so users see the underlying failure."""
+    while isinstance(error, BaseExceptionGroup) and error.exceptions:
+        error = error.exceptions[0]
+    return error
+
+
+async def check_llm(llm_client: AsyncOpenAI) -> bool:
+    """Confirm the LLM server is reachable."""
     try:
-        await llm_client.chat.completions.create(
-            model="local",
-            messages=[{"role": "user", "content": "Hi"}],
-            max_tokens=5
-        )
+        try:
+            # Listing models proves liveness without running inference.
+            await llm_client.models.list()
+        except NotFoundError:
+            await llm_client.chat.completions.create(
+                model=LLM_MODEL,
+                messages=[{"role": "user", "content": "Hi"}],
+                max_tokens=5
+            )
         console.print("[green]✓[/green] LLM connected")
+        return True
     except Exception as e:
-        healthy = False
         console.print(f"[bold red]✗ LLM connection failed:[/bold red] {e}")
         console.print("[yellow]Start it via 'scripts/start_llm_server.sh' (Docker required).[/yellow]")
+        return False
+
+
+def report_mcp_failure(error: BaseException) -> None:
+    """Tell the user the MCP gateway is down and how to start it."""
+    console.print(f"[bold red]✗ MCP gateway unreachable:[/bold red] {_root_error(error)}")
+    console.print("[yellow]Start it via 'scripts/start_mcp_gateway.sh'.[/yellow]")
 
+
+async def check_mcp(session: ClientSession) -> bool:
+    """Initialize `session` and record the gateway's tools."""
     try:
-        async with streamablehttp_client(mcp_endpoint) as (read, write, _):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                await session.list_tools()
+        await session.initialize()
+        tools = await session.list_tools()
+        _mcp_tools.update(tool.name for tool in tools.tools)
         console.print("[green]✓[/green] MCP gateway connected")
+        return True
     except Exception as e:
-        healthy = False
-        console.print(f"[bold red]✗ MCP gateway unreachable:[/bold red] {e}")
-        console.print("[yellow]Start it via 'scripts/start_mcp_gateway.sh'.[/yellow]")
-
-    return healthy
+        report_mcp_failure(e)
+        return False
 
 
 def parse_args() -> argparse.Namespace:
@@ -183,6 +583,18 @@ def parse_args() -> argparse.Namespace:
         default=15,
         help="How many search hits to inspect for each person."
     )
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=4,
+        help="How many transcripts to summarize per LLM request (default: 4)."
+    )
+    parser.add_argument(
+        "--llm-parallel",
+        type=positive_int,
+        default=DEFAULT_LLM_PARALLEL,
+        help=f"Max concurrent LLM requests; match the server's --parallel (default: {DEFAULT_LLM_PARALLEL})."
+    )
     parser.add_argument(
         "--llm-endpoint",
         default=DEFAULT_LLM_ENDPOINT,
@@ -193,6 +605,22 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_MCP_ENDPOINT,
         help=f"MCP gateway endpoint (default: {DEFAULT_MCP_ENDPOINT})."
     )
+    parser.add_argument(
+        "--semantic-cache",
+        action="store_true",
+        help="Also reuse summaries of near-identical transcripts (needs sentence-transformers)."
+    )
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        default=Path(DEFAULT_CACHE_PATH),
+        help=f"Where transcripts and summaries are cached between runs (default: {DEFAULT_CACHE_PATH})."
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the on-disk cache and always fetch and summarize fresh."
+    )
     parser.add_argument(
         "--smoke-test",
         action="store_true",
@@ -201,82 +629,142 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-async def main() -> None:
-    """Main execution."""
-    args = parse_args()
-    console.print(Panel("[bold cyan]🎙️ YouTube Podcast Analyzer[/bold cyan]", border_style="cyan"))
+async def analyze(session: ClientSession, llm_client: AsyncOpenAI, args: argparse.Namespace) -> None:
+    """Fetch transcripts for every person, summarize them and print the results."""
+    all_podcasts: List[Podcast] = []
 
-    llm_client = AsyncOpenAI(base_url=args.llm_endpoint, api_key="not-needed")
+    with console.status("[bold green]Fetching podcasts...") as status:
+        done = 0
 
-    if not await verify_services(llm_client, args.mcp_endpoint):
+        async def run_person(person: str) -> List[Transcript]:
+            nonlocal done
+            try:
+                transcripts = await fetch_transcripts(
+                    session,
+                    person,
+                    videos_per_person=args.per_person,
+                    max_search_results=args.max_search_results,
+                )
+            except Exception as e:
+                # Handle it here so one person's failure doesn't cancel the others.
+                transcripts = []
+                console.print(f"[bold red]✗ {person}:[/bold red] {e}")
+            else:
+                console.print(f"[green]✓[/green] {person}: {len(transcripts)} transcripts")
+            done += 1
+            status.update(f"[bold green]Fetched transcripts for {done}/{len(args.people)} people...")
+            return transcripts
+
+        # ClientSession multiplexes requests by id, so all people can share it.
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(run_person(person)) for person in args.people]
+
+        all_transcripts = [t for task in tasks for t in task.result()]
+
+    if not all_transcripts:
+        console.print("[bold yellow]No podcasts were summarized. Try different names or raise --max-search-results.[/bold yellow]")
         return
 
-    if args.smoke_test:
-        console.print("[bold green]Smoke test passed — you're ready to run without --smoke-test.[/bold green]")
+    console.print()
+    table = Table(
+        title="📊 Podcast Analysis",
+        box=box.ROUNDED,
+        show_lines=True,
+        title_style="bold cyan"
+    )
+
+    table.add_column("Person", style="cyan bold", width=12)
+    table.add_column("Title", style="white", width=30)
+    table.add_column("Topics", style="yellow", width=35)
+    table.add_column("Insights", style="green", width=40)
+
+    # Rows appear as each batch of summaries lands instead of all at the end.
+    with Live(table, console=console, refresh_per_second=4):
+        async for podcasts in summarize_transcripts(
+            llm_client, all_transcripts, batch_size=args.batch_size
+        ):
+            for p in podcasts:
+                table.add_row(p.person, p.title, p.topics, p.insights)
+            all_podcasts.extend(podcasts)
+
+    if not all_podcasts:
+        console.print("[bold yellow]No podcasts were summarized. Try different names or raise --max-search-results.[/bold yellow]")
         return
 
-    try:
-        async with streamablehttp_client(args.mcp_endpoint) as (read, write, _):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-
-                all_podcasts: List[Podcast] = []
-
-                with console.status("[bold green]Fetching podcasts...") as status:
-                    for person in args.people:
-                        status.update(f"[bold green]Processing {person}...")
-                        podcasts = await fetch_podcasts(
-                            session,
-                            llm_client,
-                            person,
-                            videos_per_person=args.per_person,
-                            max_search_results=args.max_search_results,
-                        )
-                        all_podcasts.extend(podcasts)
-                        console.print(f"[green]✓[/green] {person}: {len(podcasts)} podcasts")
-
-                if not all_podcasts:
-                    console.print("[bold yellow]No podcasts were summarized. Try different names or raise --max-search-results.[/bold yellow]")
-                    return
-
-                console.print()
-                table = Table(
-                    title="📊 Podcast Analysis",
-                    box=box.ROUNDED,
-                    show_lines=True,
-                    title_style="bold cyan"
-                )
+    counts = Counter(p.person for p in all_podcasts)
+    console.print()
+    console.print(Panel(
+        f"[bold]Total Podcasts:[/bold] {len(all_podcasts)}\n"
+        + "\n".join(f"• {name}: {counts[name]}" for name in args.people),
+        title="📈 Summary",
+        border_style="green"
+    ))
+
+
+async def main() -> None:
+    """Main execution."""
+    global _disk_cache, _llm_slots
+    args = parse_args()
+    _llm_slots = asyncio.Semaphore(args.llm_parallel)
+    console.print(Panel("[bold cyan]🎙️ YouTube Podcast Analyzer[/bold cyan]", border_style="cyan"))
 
-                table.add_column("Person", style="cyan bold", width=12)
-                table.add_column("Title", style="white", width=30)
-                table.add_column("Topics", style="yellow", width=35)
-                table.add_column("Insights", style="green", width=40)
+    if not args.smoke_test:
+        await load_encoder()
 
-                for p in all_podcasts:
-                    table.add_row(p.person, p.title, p.topics, p.insights)
+        if args.semantic_cache:
+            enable_semantic_cache()
 
-                console.print(table)
+        if not args.no_cache:
+            try:
+                _disk_cache = DiskCache(args.cache_path.expanduser())
+            except (OSError, sqlite3.Error) as e:
+                console.print(f"[bold red]Can't open cache at {args.cache_path}:[/bold red] {e}")
+                console.print("[yellow]Pick another --cache-path or pass --no-cache.[/yellow]")
+                return
 
-                console.print()
-                console.print(Panel(
-                    f"[bold]Total Podcasts:[/bold] {len(all_podcasts)}\n"
-                    + "\n".join([
-                        f"• {name}: {sum(1 for p in all_podcasts if p.person == name)}"
-                        for name in args.people
-                    ]),
-                    title="📈 Summary",
-                    border_style="green"
-                ))
+    # One pooled HTTP client so concurrent summaries reuse keep-alive connections.
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+    async with AsyncOpenAI(
+        base_url=args.llm_endpoint, api_key="not-needed", http_client=http_client
+    ) as llm_client:
+        # Its own task, so the LLM result is reported even if the MCP transport blows up.
+        llm_check = asyncio.create_task(check_llm(llm_client))
+        mcp_ok: Optional[bool] = None
+        try:
+            # A single MCP connection serves both the health check and the run.
+            async with streamablehttp_client(args.mcp_endpoint) as (read, write, _):
+                async with ClientSession(read, write) as session:
+                    mcp_ok = await check_mcp(session)
+                    llm_ok = await llm_check
+                    if not (llm_ok and mcp_ok):
+                        return
 
-    except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
-        console.print("\n[yellow]Make sure services are still running:[/yellow]")
-        console.print(f"  MCP: {args.mcp_endpoint}")
-        console.print(f"  LLM: {args.llm_endpoint}")
-        console.print("\n[cyan]Restart scripts if needed:[/cyan]")
-        console.print("  scripts/start_llm_server.sh")
-        console.print("  scripts/start_mcp_gateway.sh")
+                    if args.smoke_test:
+                        console.print("[bold green]Smoke test passed — you're ready to run without --smoke-test.[/bold green]")
+                        return
+
+                    await analyze(session, llm_client, args)
 
+        except Exception as e:
+            if mcp_ok is None:
+                # Connection failures surface from the transport, not from initialize().
+                report_mcp_failure(e)
+                await llm_check
+            elif mcp_ok:
+                console.print(f"[bold red]Error:[/bold red] {_root_error(e)}")
+                console.print("\n[yellow]Make sure services are still running:[/yellow]")
+                console.print(f"  MCP: {args.mcp_endpoint}")
+                console.print(f"  LLM: {args.llm_endpoint}")
+                console.print("\n[cyan]Restart scripts if needed:[/cyan]")
+                console.print("  scripts/start_llm_server.sh")
+                console.print("  scripts/start_mcp_gateway.sh")
+            # mcp_ok is False: check_mcp already reported it; ignore transport teardown errors.
+        finally:
+            if _disk_cache:
+                _disk_cache.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -4,8 +4,14 @@ set -euo pipefail
 PORT=${PORT:-1234}
 HOST=${HOST:-0.0.0.0}
 MODEL_REPO=${MODEL_REPO:-ggml-org/gemma-3-270m-it-GGUF}
+# Quantized weights cut memory bandwidth per token; use Q4_K_M for repos that ship it.
+MODEL_QUANT=${MODEL_QUANT:-Q8_0}
 IMAGE=${IMAGE:-ghcr.io/ggml-org/llama.cpp:server}
-CONTEXT=${CONTEXT:-4096}
+# Parallel slots let concurrent summaries decode in one continuous batch.
+# Keep in sync with the analyzer's --llm-parallel.
+PARALLEL=${PARALLEL:-4}
+# llama.cpp splits the context across slots, so this gives each slot 8192 tokens.
+CONTEXT=${CONTEXT:-$((8192 * PARALLEL))}
 PULL_IMAGE=${PULL_IMAGE:-true}
 
 if ! command -v docker >/dev/null 2>&1; then
@@ -25,14 +31,16 @@ if [[ "${PULL_IMAGE}" != "false" && "${PULL_IMAGE}" != "0" ]]; then
 fi
 shopt -u nocasematch
 
-echo "Starting llama.cpp server on ${HOST}:${PORT} using ${MODEL_REPO}..."
+echo "Starting llama.cpp server on ${HOST}:${PORT} using ${MODEL_REPO}:${MODEL_QUANT} (${PARALLEL} slots)..."
 
 docker run --rm \
   -p "${PORT}:${PORT}" \
   "${IMAGE}" \
-  -hf "${MODEL_REPO}" \
+  -hf "${MODEL_REPO}:${MODEL_QUANT}" \
   --port "${PORT}" \
   --host "${HOST}" \
   --jinja \
   -c "${CONTEXT}" \
+  --parallel "${PARALLEL}" \
+  --cont-batching \
   "$@"